@@ -3,6 +3,7 @@ Main controller for Galvonium Laser GUI.
 Coordinates between GUI components and serial communication.
 """
 
+import time
 from typing import Optional, List, Callable
 from PyQt5.QtCore import QObject, pyqtSignal
 
@@ -55,6 +56,12 @@ class GalvoController(QObject):
         self._response_lines: List[str] = []
         self._current_operation: Optional[str] = None
 
+        # Port-list cache: the OS device scan is slow (per-port opens on
+        # Windows) and the UI may refresh often. -inf timestamp forces the
+        # first call to scan.
+        self._ports_cache: List[str] = []
+        self._ports_ts = float("-inf")
+
         # Wire serial connection signals
         self._wire_serial_signals()
 
@@ -103,14 +110,22 @@ class GalvoController(QObject):
         """Check if currently connected to device."""
         return self._is_connected
 
+    PORTS_CACHE_TTL = 0.5  # seconds
+
     def get_available_ports(self) -> List[str]:
-        """Get list of available serial ports."""
+        """Get list of available serial ports (cached for a short TTL)."""
+        now = time.monotonic()
+        if now - self._ports_ts < self.PORTS_CACHE_TTL:
+            return self._ports_cache
+
         try:
             from serialio.connection import list_serial_ports
 
-            return list_serial_ports()
+            self._ports_cache = list_serial_ports()
         except ImportError:
-            return []
+            self._ports_cache = []
+        self._ports_ts = now
+        return self._ports_cache
 
     # === Buffer Operations ===
 
@@ -189,20 +204,26 @@ class GalvoController(QObject):
             self._current_operation = "write"
             self.operation_progress.emit(0, f"Writing to {buffer_name} buffer...")
 
-            # Generate write sequence
-            commands = self._buffer_data.get_write_sequence(buffer_name)
-            total_commands = len(commands)
+            # CLEAR, then all WRITE commands as one pre-encoded payload, then
+            # SIZE: three serial writes for a full flush instead of one per
+            # command.
+            if not self._serial_conn.write(cmd_clear(buffer_name)):
+                self.error_occurred.emit("Failed to send CLEAR command")
+                return False
 
-            # Send commands with progress updates
-            for i, command in enumerate(commands):
-                if not self._serial_conn.write(command):
-                    self.error_occurred.emit(f"Failed to send command: {command}")
-                    return False
+            n_steps = self._buffer_data.get_size_for_write()
+            self.operation_progress.emit(10, f"Sending {n_steps} steps...")
 
-                progress = int((i + 1) / total_commands * 100)
-                self.operation_progress.emit(
-                    progress, f"Sent {i + 1}/{total_commands} commands"
-                )
+            payload = self._buffer_data.to_write_payload(buffer_name)
+            if not self._serial_conn.send_payload(payload):
+                self.error_occurred.emit("Failed to send WRITE payload")
+                return False
+
+            if not self._serial_conn.write(
+                self._buffer_data.to_size_command(buffer_name)
+            ):
+                self.error_occurred.emit("Failed to send SIZE command")
+                return False
 
             self.operation_progress.emit(100, f"Buffer written to {buffer_name}")
             self.status_message.emit(f"Buffer written to {buffer_name}", 3000)
@@ -318,6 +339,12 @@ class GalvoController(QObject):
 
     # === Cleanup ===
 
+    def reset(self):
+        """Return the controller to an idle state with an empty buffer."""
+        self._response_lines.clear()
+        self._current_operation = None
+        self._buffer_data.clear()
+
     def cleanup(self):
         """Clean up resources before shutdown."""
         if self._is_connected:
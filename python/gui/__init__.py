@@ -22,6 +22,7 @@ from .control_panel import ControlPanel, StatusLED
 from .buffer_table import BufferTableWidget, BufferTableModel
 from .terminal_widget import TerminalWidget
 from .connection_manager import ConnectionManager
+from .data_visualizer import DataVisualizer
 
 # Re-export main classes for convenient access
 __all__ = [
@@ -32,6 +33,7 @@ __all__ = [
     "BufferTableModel",
     "TerminalWidget",
     "ConnectionManager",
+    "DataVisualizer",
 ]
 
 # Version information
@@ -11,30 +11,21 @@ BIN_FULL_RE = re.compile(r"^[01]{1,8}$")
 DEC_QRE = QtCore.QRegularExpression(r"^[0-9]{1,3}$")
 DEC_FULL_RE = re.compile(r"^[0-9]{1,3}$")
 
+_RED_BRUSH = QtGui.QBrush(QtGui.QColor("#ffcccc"))  # invalid-cell highlight
 
-class DecimalDelegate(QtWidgets.QStyledItemDelegate):
-    """Editor that accepts only decimal numbers 0-255 for X and Y columns."""
 
-    def createEditor(self, parent, option, index):
-        editor = QtWidgets.QLineEdit(parent)
-        validator = QtGui.QRegularExpressionValidator(DEC_QRE, editor)
-        editor.setValidator(validator)
-        editor.setMaxLength(3)
-        editor.setPlaceholderText("0")
-        editor.setFont(QtGui.QFont("Consolas"))
-        return editor
+def _parse_bin(text: str):
+    """Parse up to 8 binary digits; None if invalid."""
+    if not text or len(text) > 8:
+        return None
+    try:
+        return int(text, 2)
+    except ValueError:
+        return None
 
-    def setEditorData(self, editor, index):
-        if not isinstance(editor, QtWidgets.QLineEdit):
-            return super().setEditorData(editor, index)
-        val = index.model().data(index, QtCore.Qt.EditRole)
-        editor.setText(val)
 
-    def setModelData(self, editor, model, index):
-        if not isinstance(editor, QtWidgets.QLineEdit):
-            return super().setModelData(editor, model, index)
-        text = editor.text()
-        model.setData(index, text, role=QtCore.Qt.EditRole)
+_MONO_FONT = QtGui.QFont("Consolas")  # shared monospace for editors/table
+_ZERO_ROW = ("0", "0", "00000000")  # display strings for an empty step
 
 
 class BinaryDelegate(QtWidgets.QStyledItemDelegate):
@@ -47,7 +38,7 @@ class BinaryDelegate(QtWidgets.QStyledItemDelegate):
         editor.setMaxLength(8)
         editor.setPlaceholderText("00000000")
         # Monospace makes bits readable
-        editor.setFont(QtGui.QFont("Consolas"))
+        editor.setFont(_MONO_FONT)
         return editor
 
     def setEditorData(self, editor, index):
@@ -69,6 +60,26 @@ class BufferTableModel(QtCore.QAbstractTableModel):
     def __init__(self, buffer: Optional[BufferData] = None, parent=None):
         super().__init__(parent)
         self._buffer: BufferData = buffer if buffer is not None else BufferData()
+        self._rebuild_display()
+        # Invalid-cell flags as a flat row*4+col bitmap: one byte read per
+        # painted cell instead of hashing a (row, col) tuple.
+        self._invalid = bytearray(1024)
+        # Bulk-update depth: while > 0, setData suppresses per-cell
+        # dataChanged emissions; end_bulk_update emits one whole-table
+        # signal instead.
+        self._bulk = 0
+
+    def _rebuild_display(self):
+        """Re-derive the per-cell display strings from the buffer.
+
+        Qt calls data() for every visible cell on each repaint, so the
+        strings are formatted once here (and patched cell-wise in setData)
+        instead of per paint.
+        """
+        self._display = [
+            [str(step.x), str(step.y), format(step.flags, "08b")]
+            for step in self._buffer.steps
+        ]
 
     # ── Qt model API ───────────────────────────────────────────────────────
     def rowCount(self, parent=QtCore.QModelIndex()):
@@ -97,22 +108,25 @@ class BufferTableModel(QtCore.QAbstractTableModel):
             return None
         row, col = index.row(), index.column()
 
-        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+        if role == QtCore.Qt.DisplayRole:
             if col == 0:
                 return row  # Index decimal
-            step = self._buffer.get_step(row)
-            if col == 1:
-                # X column - display and edit in decimal
-                return str(step.x)
-            if col == 2:
-                # Y column - display and edit in decimal
-                return str(step.y)
+            # X/Y decimal, Flags binary — all pre-formatted on write
+            return self._display[row][col - 1]
+
+        if role == QtCore.Qt.EditRole:
+            if col == 0:
+                return row
             if col == 3:
-                # Flags column - display and edit in binary
-                if role == QtCore.Qt.DisplayRole:
-                    return f"{step.flags:08b}"
-                else:
-                    return f"{step.flags:08b}"  # Edit role also binary
+                return self._display[row][2]
+            # X/Y edit in binary even though they display decimal
+            step = self._buffer.get_step(row)
+            return format(step.x if col == 1 else step.y, "08b")
+
+        if role == QtCore.Qt.BackgroundRole:
+            if self._invalid[row * 4 + col]:
+                return _RED_BRUSH
+            return None
 
         if role == QtCore.Qt.TextAlignmentRole:
             if col == 0:
@@ -131,46 +145,68 @@ class BufferTableModel(QtCore.QAbstractTableModel):
         text = str(value).strip()
         step = self._buffer.get_step(row)
 
-        if col == 1 or col == 2:  # X or Y columns - decimal validation
-            if not DEC_FULL_RE.fullmatch(text):
-                return False
-
-            try:
-                intval = int(text)
-                if intval < 0 or intval > 255:
-                    return False
-            except ValueError:
-                return False
-
-            if col == 1:
-                step.x = intval
-            else:  # col == 2
-                step.y = intval
-
-        elif col == 3:  # Flags column - binary validation
-            if not BIN_FULL_RE.fullmatch(text):
-                return False
-
-            try:
-                intval = int(text, 2)
-            except ValueError:
-                return False
+        # All editable columns take binary input (up to 8 bits); the single
+        # int(text, 2) call is the whole validation.
+        intval = _parse_bin(text)
+        if intval is None:
+            return self._mark_invalid(index)
+
+        if col == 1:
+            step.x = intval
+            self._display[row][0] = str(intval)
+        elif col == 2:
+            step.y = intval
+            self._display[row][1] = str(intval)
+        elif col == 3:
             step.flags = intval
+            self._display[row][2] = format(intval, "08b")
         else:
             return False
 
-        self.dataChanged.emit(index, index)
+        self._invalid[row * 4 + col] = 0
+        if self._bulk == 0:
+            self.dataChanged.emit(index, index)
         return True
 
+    def _mark_invalid(self, index) -> bool:
+        """Flag a cell as invalid (red background) and report edit failure."""
+        self._invalid[index.row() * 4 + index.column()] = 1
+        if self._bulk == 0:
+            self.dataChanged.emit(index, index)
+        return False
+
+    @property
+    def _invalid_cells(self) -> Set[Tuple[int, int]]:
+        """Set view over the invalid-cell bitmap (used by tests/tools)."""
+        return {
+            (i >> 2, i & 3) for i, flag in enumerate(self._invalid) if flag
+        }
+
     # ── Public API for widget wrapper ──────────────────────────────────────
+    def begin_bulk_update(self):
+        """Suppress per-cell dataChanged until the matching end call."""
+        self._bulk += 1
+
+    def end_bulk_update(self):
+        """Close a bulk update, emitting one whole-table dataChanged."""
+        self._bulk -= 1
+        if self._bulk == 0:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(255, 3)
+            )
+
     def load_buffer(self, buffer: BufferData):
         self.beginResetModel()
         self._buffer = buffer
+        self._rebuild_display()
+        self._invalid = bytearray(1024)
         self.endResetModel()
 
     def clear_all(self):
         self.beginResetModel()
         self._buffer.clear()
+        self._display = [list(_ZERO_ROW) for _ in range(256)]
+        self._invalid = bytearray(1024)
         self.endResetModel()
 
     # Optional helper for external validation
@@ -178,29 +214,19 @@ class BufferTableModel(QtCore.QAbstractTableModel):
     def validate_input(
         text: str, column: int
     ) -> Tuple[bool, Optional[int], Optional[str]]:
-        if column == 1 or column == 2:  # X or Y columns
-            if not DEC_FULL_RE.fullmatch(text or ""):
-                return False, None, "Decimal only (0-255)"
-            try:
-                val = int(text)
-                if val < 0 or val > 255:
-                    return False, None, "Value must be 0-255"
-                return True, val, None
-            except ValueError:
-                return False, None, "Invalid decimal number"
-        elif column == 3:  # Flags column
-            if not BIN_FULL_RE.fullmatch(text or ""):
+        if column in (1, 2, 3):  # X, Y and Flags all take binary
+            val = _parse_bin(text or "")
+            if val is None:
                 return False, None, "Binary only (1–8 bits, e.g. 01010101)"
-            return True, int(text, 2), None
-        else:
-            return False, None, "Invalid column"
+            return True, val, None
+        return False, None, "Invalid column"
 
 
 class BufferTableView(QtWidgets.QTableView):
-    """QTableView with copy/paste support and decimal editing for X/Y, binary for Flags.
+    """QTableView with copy/paste support and binary editing for all value columns.
 
     Copy OUT: plain decimal numbers (no 0x/0b), tab-separated.
-    Paste IN: decimal for X/Y, binary for Flags, reject invalid entries and keep originals.
+    Paste IN: binary (up to 8 bits) for X/Y/Flags, reject invalid entries and keep originals.
     """
 
     validation_error = QtCore.pyqtSignal(str)
@@ -213,7 +239,7 @@ class BufferTableView(QtWidgets.QTableView):
         self.setShowGrid(True)
         self.verticalHeader().setDefaultSectionSize(22)
         self.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
-        self.setFont(QtGui.QFont("Consolas"))
+        self.setFont(_MONO_FONT)
 
     # Copy: decimals (Index as decimal, others as decimal values)
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
@@ -270,6 +296,7 @@ class BufferTableView(QtWidgets.QTableView):
             return
         lines = [ln for ln in text.splitlines() if ln.strip() != ""]
         err_count = 0
+        model.begin_bulk_update()
         for dr, line in enumerate(lines):
             cols = [c for c in line.split("\t")]
             for dc, token in enumerate(cols):
@@ -283,9 +310,10 @@ class BufferTableView(QtWidgets.QTableView):
                     continue
                 # Set EditRole with the token text
                 model.setData(idx, token.strip(), role=QtCore.Qt.EditRole)
+        model.end_bulk_update()
         if err_count:
             self.validation_error.emit(
-                "Some cells rejected: check input format (decimal 0-255 for X/Y, binary for Flags)."
+                "Some cells rejected: check input format (binary, up to 8 bits)."
             )
 
 
@@ -308,11 +336,11 @@ class BufferTableWidget(QtWidgets.QWidget):
         # Hide row numbers to prevent confusion with duplicate index columns
         self._view.verticalHeader().setVisible(False)
 
-        # Decimal delegate for X, Y columns, Binary delegate for Flags
-        decimal_delegate = DecimalDelegate(self._view)
+        # Binary delegate for all editable columns (display stays decimal
+        # for X/Y)
         binary_delegate = BinaryDelegate(self._view)
-        self._view.setItemDelegateForColumn(1, decimal_delegate)  # X
-        self._view.setItemDelegateForColumn(2, decimal_delegate)  # Y
+        self._view.setItemDelegateForColumn(1, binary_delegate)  # X
+        self._view.setItemDelegateForColumn(2, binary_delegate)  # Y
         self._view.setItemDelegateForColumn(3, binary_delegate)  # Flags
 
         # Column sizing
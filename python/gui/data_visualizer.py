@@ -0,0 +1,167 @@
+"""
+Live data visualizer for streamed galvo coordinates.
+
+The Arduino can stream sampled galvo positions as lines of two Q8.8
+fixed-point hex words ("X Y", e.g. "1A80 0240"). This widget collects the
+decoded coordinates for plotting/export.
+"""
+
+from array import array
+
+import numpy as np
+from PyQt5 import QtCore, QtWidgets
+
+# Q8.8 decode lookup table: the domain is only 16 bits, so every possible
+# code is decoded once at import (high byte = integer part, low byte =
+# fractional 1/256ths). The hot parse path is then a single indexed load
+# instead of shift/mask arithmetic per sample. ~256 KB of float32.
+_Q88_LUT = array("f", ((i >> 8) + (i & 0xFF) / 256.0 for i in range(65536)))
+
+# NumPy view over the same table for batch decodes (zero-copy).
+_Q88_LUT_NP = np.frombuffer(_Q88_LUT, dtype=np.float32)
+
+
+class DataVisualizer(QtWidgets.QWidget):
+    """Collects and decodes streamed "X Y" Q8.8 coordinate lines."""
+
+    coordinates_updated = QtCore.pyqtSignal(int)  # total samples collected
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.is_collecting = False
+
+        # Coordinates live in preallocated float32 arrays (amortized
+        # doubling) rather than Python lists; x_coords/y_coords expose views.
+        self._x_arr = np.empty(4096, dtype=np.float32)
+        self._y_arr = np.empty(4096, dtype=np.float32)
+        self._count = 0
+
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+
+        self.start_stop_btn = QtWidgets.QPushButton("Start")
+        self.start_stop_btn.clicked.connect(self.toggle_collection)
+        layout.addWidget(self.start_stop_btn)
+
+        self.export_btn = QtWidgets.QPushButton("Export")
+        self.export_btn.setEnabled(False)
+        layout.addWidget(self.export_btn)
+
+        layout.addStretch(1)
+
+    @property
+    def x_coords(self):
+        """Collected X coordinates (read-only float32 view)."""
+        return self._x_arr[: self._count]
+
+    @property
+    def y_coords(self):
+        """Collected Y coordinates (read-only float32 view)."""
+        return self._y_arr[: self._count]
+
+    def xy_ndarray(self):
+        """Both coordinate views as a (x, y) tuple for zero-copy plotting."""
+        return self.x_coords, self.y_coords
+
+    def _reserve(self, extra: int):
+        """Grow the coordinate arrays to fit `extra` more samples."""
+        needed = self._count + extra
+        capacity = len(self._x_arr)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            for name in ("_x_arr", "_y_arr"):
+                grown = np.empty(capacity, dtype=np.float32)
+                grown[: self._count] = getattr(self, name)[: self._count]
+                setattr(self, name, grown)
+
+    @staticmethod
+    def _hex_q88_to_decimal(s: str) -> float:
+        """
+        Decode a Q8.8 fixed-point hex word to a float.
+
+        Args:
+            s: Hex string like "1A80" (at most 4 digits)
+
+        Raises:
+            ValueError: If the string is not a valid 16-bit hex word
+        """
+        if len(s) > 4:
+            raise ValueError(f"Q8.8 word too long: {s!r}")
+        code = int(s, 16)
+        # int() accepts a sign, so "-1" passes the length guard but would
+        # index the table from the end instead of failing.
+        if code < 0:
+            raise ValueError(f"Q8.8 word out of range: {s!r}")
+        return _Q88_LUT[code]
+
+    def toggle_collection(self):
+        """Start or stop collecting streamed coordinates."""
+        self.is_collecting = not self.is_collecting
+        self.start_stop_btn.setText("Stop" if self.is_collecting else "Start")
+        self.export_btn.setEnabled(
+            not self.is_collecting and len(self.x_coords) > 0
+        )
+
+    def clear_data(self):
+        """Drop all collected coordinates."""
+        self._count = 0
+        self.export_btn.setEnabled(False)
+
+    def process_data_batch(self, lines) -> int:
+        """
+        Decode a batch of "X Y" coordinate lines and append them.
+
+        Malformed lines are skipped. The Q8.8 decode for the whole batch is
+        one vectorized table lookup instead of per-sample arithmetic.
+
+        Args:
+            lines: Iterable of two-hex-word coordinate lines
+
+        Returns:
+            Number of samples stored (0 if not collecting)
+        """
+        if not self.is_collecting:
+            return 0
+
+        codes = []
+        for line in lines:
+            parts = line.split()
+            if len(parts) != 2 or len(parts[0]) > 4 or len(parts[1]) > 4:
+                continue
+            try:
+                x_code = int(parts[0], 16)
+                y_code = int(parts[1], 16)
+            except ValueError:
+                continue
+            # int() accepts a sign, so "-100" slips past the length guard;
+            # negative codes would overflow the uint16 batch array below.
+            if not (0 <= x_code <= 0xFFFF and 0 <= y_code <= 0xFFFF):
+                continue
+            codes.append(x_code)
+            codes.append(y_code)
+
+        n = len(codes) // 2
+        if not n:
+            return 0
+
+        arr = np.array(codes, dtype=np.uint16)
+        self._reserve(n)
+        self._x_arr[self._count : self._count + n] = _Q88_LUT_NP[arr[0::2]]
+        self._y_arr[self._count : self._count + n] = _Q88_LUT_NP[arr[1::2]]
+        self._count += n
+        self.coordinates_updated.emit(self._count)
+        return n
+
+    def process_data(self, line: str) -> bool:
+        """
+        Decode one "X Y" coordinate line and append it.
+
+        Args:
+            line: Two whitespace-separated Q8.8 hex words
+
+        Returns:
+            True if the line was parsed and stored, False if ignored
+            (not collecting) or malformed
+        """
+        return self.process_data_batch((line,)) == 1
@@ -4,13 +4,52 @@ Represents the 256-step buffer with validation.
 """
 
 from typing import List, Tuple, Optional, ClassVar
+import mmap
+import os
 import re
 
+import numpy as np
 
-class BufferStep:
-    """Single step in the galvo buffer."""
+# Shared-memory layout for BufferData(shared_path=...): a small header
+# followed by the three 256-byte columns. An external consumer (e.g. a native
+# serial writer) maps the same file and reads the steps zero-copy, polling
+# the generation counter to detect updates.
+_SHM_MAGIC = b"GLVO"
+_SHM_HEADER = 16  # magic (4) + generation uint32 (4) + reserved (8)
+_SHM_SIZE = 4096
+
+# Dump lines look like "12: 128,64 240"; compiled once at import instead of
+# per from_dump_response call.
+_DUMP_LINE_RE = re.compile(r"(\d+):\s*(\d+),(\d+)\s+(\d+)")
+
+# The buffer shape is fixed at 256 steps, so the per-index "WRITE <i> " part of
+# every command is known ahead of time. Precomputing it once keeps the hot
+# command-generation loop down to value formatting only.
+_WRITE_PREFIXES: Tuple[str, ...] = tuple(f"WRITE {i} " for i in range(256))
 
-    def __init__(self, index: int, x: int = 0, y: int = 0, flags: int = 0):
+
+class BufferStep:
+    """
+    Single step in the galvo buffer.
+
+    A lightweight view over typed uint8 storage: steps handed out by
+    BufferData share its column arrays, while standalone steps own a
+    one-element column each. Bounds checking comes from the dtype
+    itself (uint8 assignment raises OverflowError in C), translated to
+    ValueError to keep the original validation semantics.
+    """
+
+    __slots__ = ("index", "_xs", "_ys", "_flags", "_pos")
+
+    def __init__(
+        self,
+        index: int,
+        x: int = 0,
+        y: int = 0,
+        flags: int = 0,
+        _columns: Optional[tuple] = None,
+        _pos: int = 0,
+    ):
         """
         Initialize a buffer step.
 
@@ -21,53 +60,64 @@ class BufferStep:
             flags: Control flags (0-255)
         """
         self.index = index
-        self._x = 0
-        self._y = 0
-        self._flags = 0
-
-        # Use properties to validate
-        self.x = x
-        self.y = y
-        self.flags = flags
+        if _columns is None:
+            self._xs = np.zeros(1, dtype=np.uint8)
+            self._ys = np.zeros(1, dtype=np.uint8)
+            self._flags = np.zeros(1, dtype=np.uint8)
+            self._pos = 0
+            # Use properties to validate
+            self.x = x
+            self.y = y
+            self.flags = flags
+        else:
+            # Shared-column steps are views over BufferData's storage; the
+            # backing store already holds the data (possibly attached via
+            # shared memory), so don't overwrite it with the defaults.
+            self._xs, self._ys, self._flags = _columns
+            self._pos = _pos
 
     @property
     def x(self) -> int:
-        return self._x
+        return self._xs[self._pos]
 
     @x.setter
     def x(self, value: int):
-        if not 0 <= value <= 255:
-            raise ValueError(f"X value {value} out of range (0-255)")
-        self._x = value
+        try:
+            self._xs[self._pos] = value
+        except OverflowError:
+            raise ValueError(f"X value {value} out of range (0-255)") from None
 
     @property
     def y(self) -> int:
-        return self._y
+        return self._ys[self._pos]
 
     @y.setter
     def y(self, value: int):
-        if not 0 <= value <= 255:
-            raise ValueError(f"Y value {value} out of range (0-255)")
-        self._y = value
+        try:
+            self._ys[self._pos] = value
+        except OverflowError:
+            raise ValueError(f"Y value {value} out of range (0-255)") from None
 
     @property
     def flags(self) -> int:
-        return self._flags
+        return self._flags[self._pos]
 
     @flags.setter
     def flags(self, value: int):
-        if not 0 <= value <= 255:
-            raise ValueError(f"Flags value {value} out of range (0-255)")
-        self._flags = value
+        try:
+            self._flags[self._pos] = value
+        except OverflowError:
+            raise ValueError(f"Flags value {value} out of range (0-255)") from None
 
     @property
     def flags_binary(self) -> str:
         """Return flags as 8-bit binary string."""
-        return format(self._flags, "08b")
+        return format(self._flags[self._pos], "08b")
 
     def is_empty(self) -> bool:
         """Check if this step is empty (all zeros)."""
-        return self._x == 0 and self._y == 0 and self._flags == 0
+        pos = self._pos
+        return not (self._xs[pos] or self._ys[pos] or self._flags[pos])
 
     def to_write_command(self, target: str = "INACTIVE") -> str:
         """
@@ -91,16 +141,69 @@ class BufferStep:
 class BufferData:
     """Complete buffer data model with 256 steps."""
 
-    def __init__(self):
-        """Initialize empty buffer with 256 steps."""
-        self.steps: List[BufferStep] = [BufferStep(i) for i in range(256)]
+    def __init__(self, shared_path: Optional[str] = None):
+        """
+        Initialize empty buffer with 256 steps stored as three uint8
+        columns (structure-of-arrays); BufferStep objects are views.
+
+        Args:
+            shared_path: Optional file path (e.g. /dev/shm/galvo_buf) to map
+                the step columns into shared memory instead of process-local
+                arrays. Existing contents are preserved, so a second process
+                mapping the same file attaches to the same data.
+        """
+        if shared_path is None:
+            self._mm = None
+            self._generation = None
+            self._xs = np.zeros(256, dtype=np.uint8)
+            self._ys = np.zeros(256, dtype=np.uint8)
+            self._flags = np.zeros(256, dtype=np.uint8)
+        else:
+            fd = os.open(shared_path, os.O_CREAT | os.O_RDWR, 0o600)
+            try:
+                os.ftruncate(fd, _SHM_SIZE)
+                self._mm = mmap.mmap(fd, _SHM_SIZE)
+            finally:
+                os.close(fd)
+
+            self._mm[0:4] = _SHM_MAGIC
+            self._generation = np.frombuffer(
+                self._mm, dtype=np.uint32, count=1, offset=4
+            )
+            self._xs = np.frombuffer(
+                self._mm, dtype=np.uint8, count=256, offset=_SHM_HEADER
+            )
+            self._ys = np.frombuffer(
+                self._mm, dtype=np.uint8, count=256, offset=_SHM_HEADER + 256
+            )
+            self._flags = np.frombuffer(
+                self._mm, dtype=np.uint8, count=256, offset=_SHM_HEADER + 512
+            )
+
+        columns = (self._xs, self._ys, self._flags)
+        self.steps: List[BufferStep] = [
+            BufferStep(i, _columns=columns, _pos=i) for i in range(256)
+        ]
+
+    @property
+    def generation(self) -> int:
+        """Shared-memory generation counter (0 for process-local buffers)."""
+        return int(self._generation[0]) if self._generation is not None else 0
+
+    def publish(self):
+        """
+        Bump the shared-memory generation counter so an external consumer
+        knows the step data changed. No-op for process-local buffers.
+        Single-writer only; there is no cross-process locking.
+        """
+        if self._generation is not None:
+            self._generation[0] += 1
 
     def clear(self):
         """Clear all steps to (0, 0, 0)."""
-        for step in self.steps:
-            step.x = 0
-            step.y = 0
-            step.flags = 0
+        self._xs[:] = 0
+        self._ys[:] = 0
+        self._flags[:] = 0
 
     def get_step(self, index: int) -> BufferStep:
         """
@@ -141,10 +244,11 @@ class BufferData:
         Returns:
             Index of last non-empty step, or 0 if all empty
         """
-        for i in range(255, -1, -1):
-            if not self.steps[i].is_empty():
-                return i
-        return 0
+        # Single C-level scan over the 3x256-byte columns instead of up to
+        # 256 Python iterations. Not cached: the table model mutates steps
+        # directly, so a cached value could go stale.
+        nonzero = np.flatnonzero(self._xs | self._ys | self._flags)
+        return int(nonzero[-1]) if nonzero.size else 0
 
     def get_size_for_write(self) -> int:
         """
@@ -169,28 +273,63 @@ class BufferData:
         Args:
             response: Multi-line DUMP response from Arduino
         """
-        # Clear existing data
+        match = _DUMP_LINE_RE.match
+        rows = []
+        for line in response.strip().split("\n"):
+            line = line.strip()
+            if line == "EOC":
+                break
+            m = match(line)
+            if m:
+                rows.append(tuple(map(int, m.groups())))
+
+        return cls.from_rows(rows)
+
+    @classmethod
+    def from_rows(cls, rows) -> "BufferData":
+        """
+        Build buffer data from an iterable of (index, x, y, flags) int rows.
+
+        Rows with an out-of-range index are ignored, matching the tolerant
+        behaviour of the text parser.
+
+        Args:
+            rows: Iterable of (index, x, y, flags) tuples
+        """
         buf = cls()
+        for index, x, y, flags in rows:
+            if 0 <= index <= 255:
+                buf.set_step(index, x, y, flags)
+        return buf
 
-        # Parse each line until EOC
-        lines = response.strip().split("\n")
+    @classmethod
+    def from_dump_response_bin(cls, payload: bytes) -> "BufferData":
+        """
+        Parse a binary-framed DUMP response (DUMP_BIN) into buffer data.
 
-        # Pattern to match: "index: x,y flags"
-        pattern = r"(\d+):\s*(\d+),(\d+)\s+(\d+)"
+        Expected format: 768 bytes, 3 bytes per step (x, y, flags) for all
+        256 steps. One np.frombuffer call replaces the per-line regex and
+        int() conversions of the ASCII path.
 
-        for line in lines:
-            if line.strip() == "EOC":
-                break
+        Args:
+            payload: Raw 768-byte response body
+
+        Raises:
+            ValueError: If the payload is not exactly 256 * 3 bytes
+        """
+        if len(payload) != 256 * 3:
+            raise ValueError(
+                f"Binary dump must be {256 * 3} bytes, got {len(payload)}"
+            )
 
-            match = re.match(pattern, line.strip())
-            if match:
-                index = int(match.group(1))
-                x = int(match.group(2))
-                y = int(match.group(3))
-                flags = int(match.group(4))
+        arr = np.frombuffer(payload, dtype=np.uint8).reshape(256, 3)
 
-                if 0 <= index <= 255:
-                    buf.set_step(index, x, y, flags)
+        # Bulk-assign the columns; the payload bytes are uint8 by
+        # construction so no per-value validation is needed.
+        buf = cls()
+        buf._xs[:] = arr[:, 0]
+        buf._ys[:] = arr[:, 1]
+        buf._flags[:] = arr[:, 2]
 
         return buf
 
@@ -204,14 +343,32 @@ class BufferData:
         Returns:
             List of WRITE command strings
         """
-        commands = []
         last_index = self.get_last_used_index()
+        xs, ys, flags = self._xs, self._ys, self._flags
+
+        # Specialized loop: the "WRITE <i> " fragments come from the
+        # precomputed table and the values are read straight from the uint8
+        # columns, so each iteration is formatting only — no property
+        # dispatch per attribute.
+        return [
+            f"{_WRITE_PREFIXES[i]}{xs[i]} {ys[i]} {flags[i]} {target}"
+            for i in range(last_index + 1)
+        ]
+
+    def to_write_payload(self, target: str = "INACTIVE") -> bytes:
+        """
+        Generate all WRITE commands as one newline-terminated wire payload.
 
-        for i in range(last_index + 1):
-            step = self.steps[i]
-            commands.append(step.to_write_command(target))
+        Lets the serial layer push a full buffer flush in a single write
+        instead of one write per command.
 
-        return commands
+        Args:
+            target: Buffer target ("ACTIVE" or "INACTIVE")
+
+        Returns:
+            Encoded payload like b"WRITE 0 ...\\nWRITE 1 ...\\n"
+        """
+        return ("\n".join(self.to_write_commands(target)) + "\n").encode("ascii")
 
     def to_size_command(self, target: str = "INACTIVE") -> str:
         """
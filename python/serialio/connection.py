@@ -6,33 +6,61 @@ from PyQt5.QtCore import QObject, pyqtSignal, QThread
 
 from .serial_io import ThreadSafeSerialIO, SerialIOError, list_serial_ports
 
+# Standard baud rates (matches utils.validators); O(1) membership check
+# rejects typo'd rates before touching the OS port.
+_VALID_BAUDS = frozenset(
+    {300, 1200, 2400, 4800, 9600, 19200, 38400, 57600,
+     115200, 230400, 460800, 921600}
+)
+
 
 class _ReaderWorker(QObject):
     """
     Runs in its own QThread. Continuously reads lines from the serial I/O
     and emits them via a Qt signal.
+
+    Lines are gathered into bounded batches so only one queued cross-thread
+    signal fires per burst; line_received still fires per line for
+    compatibility.
     """
 
     line_received = pyqtSignal(str)
+    lines_received = pyqtSignal(list)
     error = pyqtSignal(str)
 
+    # Upper bound on lines per batch so a fast sender cannot starve the
+    # GUI of updates.
+    BATCH_LIMIT = 64
+
     def __init__(self, serial_io: ThreadSafeSerialIO, parent: Optional[QObject] = None):
         super().__init__(parent)
         self._serial_io = serial_io
 
+    def _emit_batch(self, batch):
+        if batch:
+            self.lines_received.emit(batch)
+            for line in batch:
+                self.line_received.emit(line)
+
     def start(self):
         """Main reading loop - runs in the worker thread."""
         try:
             while True:
+                batch = []
                 try:
-                    line = self._serial_io.readline()
-                    if line is None:  # Shutdown requested
-                        break
-                    if line:  # Non-empty line
-                        self.line_received.emit(line)
+                    while len(batch) < self.BATCH_LIMIT:
+                        line = self._serial_io.readline()
+                        if line is None:  # Shutdown requested
+                            self._emit_batch(batch)
+                            return
+                        if not line:  # Timeout - flush what we have
+                            break
+                        batch.append(line)
                 except SerialIOError as e:
+                    self._emit_batch(batch)
                     self.error.emit(str(e))
                     break
+                self._emit_batch(batch)
         except Exception as e:
             self.error.emit(f"Unexpected error in reader: {e!r}")
 
@@ -47,11 +75,13 @@ class SerialConnection(QObject):
 
     Signals:
         data_received(str): a single decoded line received from the port
+        lines_received(list): a batch of decoded lines (one emit per burst)
         connection_status(bool): True when connected, False when disconnected
         error_occurred(str): error text suitable for terminal/status bar
     """
 
     data_received = pyqtSignal(str)
+    lines_received = pyqtSignal(list)
     connection_status = pyqtSignal(bool)
     error_occurred = pyqtSignal(str)
 
@@ -87,6 +117,11 @@ class SerialConnection(QObject):
         """
         self.disconnect()  # idempotent
 
+        if baud not in _VALID_BAUDS:
+            self.error_occurred.emit(f"Unsupported baud rate: {baud}")
+            self.connection_status.emit(False)
+            return False
+
         try:
             success = self._serial_io.connect(port, baud)
             if not success:
@@ -102,8 +137,9 @@ class SerialConnection(QObject):
         self._reader = _ReaderWorker(self._serial_io)
         self._reader.moveToThread(self._reader_thread)
 
-        # Plumb signals
-        self._reader.line_received.connect(self.data_received)
+        # Plumb signals: the batch signal is the one that crosses the
+        # thread boundary; per-line data_received is fanned out on this side.
+        self._reader.lines_received.connect(self._on_lines_received)
         self._reader.error.connect(self.error_occurred)
         self._reader_thread.started.connect(self._reader.start)
 
@@ -112,6 +148,12 @@ class SerialConnection(QObject):
         self.connection_status.emit(True)
         return True
 
+    def _on_lines_received(self, lines: list):
+        """Re-emit a reader batch: once as a batch, then per line."""
+        self.lines_received.emit(lines)
+        for line in lines:
+            self.data_received.emit(line)
+
     def disconnect(self):
         """
         Stop reader and close the serial port.
@@ -153,6 +195,20 @@ class SerialConnection(QObject):
             self.error_occurred.emit(str(e))
             return False
 
+    def send_payload(self, data: bytes) -> bool:
+        """
+        Thread-safe write of a pre-encoded multi-command payload (each
+        command already newline-terminated). One serial write for the whole
+        blob — used for full-buffer flushes.
+        Returns True on success, False if not connected or on error.
+        """
+        try:
+            self._serial_io.write(data)
+            return True
+        except SerialIOError as e:
+            self.error_occurred.emit(str(e))
+            return False
+
     def write(self, data: str) -> bool:
         """
         Thread-safe write of data. Appends '\n'.
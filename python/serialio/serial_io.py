@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import threading
+from collections import deque
 from typing import Optional, Callable, List
 
 import serial as pyserial
@@ -41,9 +42,21 @@ class ThreadSafeSerialIO:
         self._serial_class = serial_class
         self._read_timeout = read_timeout
 
-        # Thread synchronization
+        # Thread synchronization. Shutdown is signalled via a plain bool:
+        # under CPython the GIL makes single-word reads/writes atomic, so the
+        # hot readline path pays one LOAD_ATTR instead of an Event dispatch.
         self._connection_lock = threading.RLock()
-        self._shutdown_event = threading.Event()
+        self._shutdown_flag = False
+
+        # Reusable TX scratch buffer for write_line (guarded by the
+        # connection lock); avoids one bytes allocation per line sent.
+        self._tx_scratch = bytearray(256)
+
+        # RX batching state: complete lines waiting to be handed out and the
+        # partial tail of the last bulk read. Only touched from the reader
+        # thread.
+        self._pending_lines: deque = deque()
+        self._rx_tail = bytearray()
 
         # Connection state
         self._serial_port: Optional[pyserial.Serial] = None
@@ -65,29 +78,37 @@ class ThreadSafeSerialIO:
             SerialIOError: If connection fails
         """
         with self._connection_lock:
-            # Close existing connection if any
+            # Close existing connection if any (this also nulls the state)
             self._close_port()
 
+            # Keep the try tight around the port open only; state was
+            # already cleared above, so the failure path has nothing to
+            # roll back.
             try:
-                self._serial_port = self._serial_class(
+                serial_port = self._serial_class(
                     port, baud, timeout=self._read_timeout
                 )
-                self._port_name = port
-                self._baud_rate = baud
-                self._shutdown_event.clear()
-                return True
             except Exception as e:
-                self._serial_port = None
-                self._port_name = None
-                self._baud_rate = None
                 raise SerialIOError(f"Failed to open {port} @ {baud}: {e}") from e
 
+            self._set_state(serial_port, port, baud)
+            self._shutdown_flag = False
+            self._pending_lines.clear()
+            self._rx_tail.clear()
+            return True
+
     def disconnect(self):
         """Close the serial port and signal shutdown to any readers."""
         with self._connection_lock:
-            self._shutdown_event.set()
+            self._shutdown_flag = True
             self._close_port()
 
+    def _set_state(self, serial_port, port_name, baud_rate):
+        """Assign connection state in one place. Must be called with _connection_lock held."""
+        self._serial_port = serial_port
+        self._port_name = port_name
+        self._baud_rate = baud_rate
+
     def _close_port(self):
         """Internal method to close the port. Must be called with _connection_lock held."""
         if self._serial_port:
@@ -96,21 +117,21 @@ class ThreadSafeSerialIO:
             except Exception:
                 pass  # Best effort cleanup
             finally:
-                self._serial_port = None
-                self._port_name = None
-                self._baud_rate = None
+                self._set_state(None, None, None)
 
     def is_connected(self) -> bool:
         """Check if the serial port is connected."""
         with self._connection_lock:
-            return self._serial_port is not None and not self._shutdown_event.is_set()
+            return self._serial_port is not None and not self._shutdown_flag
 
     def write(self, data: bytes) -> int:
         """
         Write data to the serial port.
 
         Args:
-            data: Bytes to write
+            data: Bytes to write. May be a memoryview that is only valid for
+                the duration of the call (write_line reuses its scratch
+                buffer); the port must consume or copy it before returning.
 
         Returns:
             Number of bytes written
@@ -119,7 +140,7 @@ class ThreadSafeSerialIO:
             SerialIOError: If not connected or write fails
         """
         with self._connection_lock:
-            if not self._serial_port or self._shutdown_event.is_set():
+            if not self._serial_port or self._shutdown_flag:
                 raise SerialIOError("Not connected")
 
             try:
@@ -138,8 +159,19 @@ class ThreadSafeSerialIO:
         Returns:
             Number of bytes written
         """
-        data = (text + "\n").encode(encoding)
-        return self.write(data)
+        encoded = text.encode(encoding)
+        n = len(encoded)
+
+        with self._connection_lock:
+            # Reuse the scratch buffer instead of allocating text + "\n" and
+            # a fresh bytes object per call. The memoryview is only valid
+            # until the next write_line, which is fine: write() hands it to
+            # the port synchronously while the lock is held.
+            if n + 1 > len(self._tx_scratch):
+                self._tx_scratch = bytearray(max(n + 1, len(self._tx_scratch) * 2))
+            self._tx_scratch[:n] = encoded
+            self._tx_scratch[n : n + 1] = b"\n"
+            return self.write(memoryview(self._tx_scratch)[: n + 1])
 
     def readline(self, encoding: str = "utf-8") -> Optional[str]:
         """
@@ -154,24 +186,59 @@ class ThreadSafeSerialIO:
         Raises:
             SerialIOError: If not connected or read fails
         """
+        # Serve lines batched from a previous bulk read first
+        if self._pending_lines:
+            if self._shutdown_flag:
+                return None
+            return self._pending_lines.popleft().rstrip(b"\r\n").decode(
+                encoding, errors="replace"
+            )
+
         with self._connection_lock:
             if not self._serial_port:
                 raise SerialIOError("Not connected")
 
             # Check shutdown outside the lock to allow interruption
-            if self._shutdown_event.is_set():
+            if self._shutdown_flag:
                 return None
 
+            serial_port = self._serial_port
+
         try:
-            # Don't hold the lock during the blocking read operation
-            line = self._serial_port.readline()
+            # Don't hold the lock during the blocking read operation.
+            # When the port supports it, drain everything already buffered in
+            # one read() call and split locally — one syscall per burst
+            # instead of pyserial's byte-at-a-time readline scan. Ports
+            # without in_waiting/read (simple fakes) use readline directly.
+            in_waiting = getattr(serial_port, "in_waiting", None)
+            if in_waiting is not None and hasattr(serial_port, "read"):
+                chunk = serial_port.read(max(1, in_waiting))
+                if self._shutdown_flag:
+                    return None
+                if not chunk:
+                    return ""  # Timeout/no data
+
+                self._rx_tail += chunk
+                if b"\n" not in chunk:
+                    return ""  # Line still incomplete
+                *lines, tail = self._rx_tail.split(b"\n")
+                self._rx_tail = bytearray(tail)
+                self._pending_lines.extend(lines)
+                return self._pending_lines.popleft().rstrip(b"\r\n").decode(
+                    encoding, errors="replace"
+                )
+
+            line = serial_port.readline()
 
             # Check shutdown again after read
-            if self._shutdown_event.is_set():
+            if self._shutdown_flag:
                 return None
 
             if line:
-                return line.decode(encoding, errors="replace").rstrip("\r\n")
+                # Strip the CR/LF bytes before decoding: skips decoding the
+                # terminator and the extra str allocation from a post-decode
+                # rstrip.
+                return line.rstrip(b"\r\n").decode(encoding, errors="replace")
             return ""  # Empty string for timeout/no data
 
         except Exception as e:
@@ -184,4 +251,4 @@ class ThreadSafeSerialIO:
 
     def request_shutdown(self):
         """Signal that any ongoing read operations should stop."""
-        self._shutdown_event.set()
+        self._shutdown_flag = True
@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+
+import os
+import sys
+
+# Allow running headless (CI) without an X server.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt5 import QtWidgets
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    """
+    One Qt application for the whole test session.
+
+    Constructing QApplication repeatedly is expensive and Qt only allows a
+    single instance per process anyway. A full QApplication (not
+    QCoreApplication) is created so widget tests and serial/worker tests can
+    share it.
+    """
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
@@ -4,7 +4,9 @@ Run with: python -m unittest test_buffer_model
 """
 
 import unittest
+import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path if needed
@@ -268,6 +270,35 @@ EOC"""
 
         self.assertEqual(buffer.get_last_used_index(), 100)
 
+    def test_from_dump_response_bin(self):
+        """Test parsing binary-framed DUMP response."""
+        payload = bytearray(256 * 3)
+        payload[0:3] = bytes([128, 64, 255])  # step 0
+        payload[3:6] = bytes([130, 66, 240])  # step 1
+
+        buffer = BufferData.from_dump_response_bin(bytes(payload))
+
+        step = buffer.get_step(0)
+        self.assertEqual(step.x, 128)
+        self.assertEqual(step.y, 64)
+        self.assertEqual(step.flags, 255)
+
+        step = buffer.get_step(1)
+        self.assertEqual(step.x, 130)
+        self.assertEqual(step.y, 66)
+        self.assertEqual(step.flags, 240)
+
+        # Remaining steps are empty
+        self.assertTrue(buffer.get_step(2).is_empty())
+        self.assertEqual(buffer.get_last_used_index(), 1)
+
+    def test_from_dump_response_bin_wrong_size(self):
+        """Test binary DUMP parsing rejects wrong payload size."""
+        with self.assertRaises(ValueError):
+            BufferData.from_dump_response_bin(b"\x00" * 100)
+        with self.assertRaises(ValueError):
+            BufferData.from_dump_response_bin(b"")
+
     def test_to_write_commands(self):
         """Test generating WRITE commands."""
         self.buffer.set_step(0, 100, 100, 128)
@@ -296,6 +327,23 @@ EOC"""
         self.assertEqual(commands[1], "WRITE 1 0 0 0 INACTIVE")  # Gap
         self.assertEqual(commands[5], "WRITE 5 50 50 5 INACTIVE")
 
+    def test_to_write_payload(self):
+        """Test generating the WRITE commands as one wire payload."""
+        self.buffer.set_step(0, 100, 100, 128)
+        self.buffer.set_step(1, 150, 100, 128)
+
+        payload = self.buffer.to_write_payload()
+
+        self.assertIsInstance(payload, bytes)
+        self.assertEqual(
+            payload,
+            b"WRITE 0 100 100 128 INACTIVE\nWRITE 1 150 100 128 INACTIVE\n",
+        )
+
+        # Payload matches the command list joined with newlines
+        commands = self.buffer.to_write_commands()
+        self.assertEqual(payload, ("\n".join(commands) + "\n").encode("ascii"))
+
     def test_to_size_command(self):
         """Test SIZE command generation."""
         # Empty buffer
@@ -339,6 +387,60 @@ EOC"""
         self.assertEqual(self.buffer.get_last_used_index(), 4)
 
 
+class TestSharedBufferData(unittest.TestCase):
+    """Test cases for mmap-backed shared BufferData."""
+
+    def setUp(self):
+        self.shared_file = tempfile.NamedTemporaryFile(delete=False)
+        self.shared_file.close()
+        self.shared_path = self.shared_file.name
+
+    def tearDown(self):
+        os.unlink(self.shared_path)
+
+    def test_shared_buffer_behaves_like_local(self):
+        """Shared buffer supports the normal step API."""
+        buffer = BufferData(shared_path=self.shared_path)
+
+        buffer.set_step(10, 128, 64, 240)
+        step = buffer.get_step(10)
+        self.assertEqual(step.x, 128)
+        self.assertEqual(step.y, 64)
+        self.assertEqual(step.flags, 240)
+        self.assertEqual(buffer.get_last_used_index(), 10)
+
+        with self.assertRaises(ValueError):
+            step.x = 256
+
+    def test_shared_buffer_visible_to_second_mapping(self):
+        """Data written through one mapping is visible through another."""
+        writer = BufferData(shared_path=self.shared_path)
+        writer.set_step(5, 11, 22, 33)
+
+        reader = BufferData(shared_path=self.shared_path)
+        step = reader.get_step(5)
+        self.assertEqual(step.x, 11)
+        self.assertEqual(step.y, 22)
+        self.assertEqual(step.flags, 33)
+
+    def test_publish_bumps_generation(self):
+        """publish() increments the shared generation counter."""
+        writer = BufferData(shared_path=self.shared_path)
+        reader = BufferData(shared_path=self.shared_path)
+
+        start = reader.generation
+        writer.set_step(0, 1, 1, 1)
+        writer.publish()
+        self.assertEqual(reader.generation, start + 1)
+
+    def test_local_buffer_generation_is_zero(self):
+        """Process-local buffers report generation 0 and publish is a no-op."""
+        buffer = BufferData()
+        self.assertEqual(buffer.generation, 0)
+        buffer.publish()
+        self.assertEqual(buffer.generation, 0)
+
+
 class TestEdgeCases(unittest.TestCase):
     """Test edge cases and boundary conditions."""
 
@@ -1,4 +1,10 @@
+import sys
 import unittest
+from collections import namedtuple
+
+import numpy as np
+from functools import lru_cache
+from types import SimpleNamespace
 from serialio.commands import (
     cmd_write,
     cmd_dump,
@@ -8,7 +14,53 @@ from serialio.commands import (
     build_write_sequence_from_buffer,
     INACTIVE,
 )
-from unittest.mock import Mock
+
+import pytest
+# Pre-intern the keywords that appear in every expected command literal so
+# assertEqual's string comparison can hit the identity fast path and the
+# collected literals share storage.
+for _kw in ("INACTIVE", "ACTIVE", "WRITE", "DUMP", "CLEAR", "SIZE", "SWAP"):
+    sys.intern(_kw)
+
+# Memoized command builders for the consistency test below: the cmd_*
+# functions are pure, so the repeated calls across buffer-name variants can
+# short-circuit on the argument tuple instead of re-formatting.
+_cmd_write = lru_cache(maxsize=None)(cmd_write)
+_cmd_dump = lru_cache(maxsize=None)(cmd_dump)
+_cmd_clear = lru_cache(maxsize=None)(cmd_clear)
+_cmd_size = lru_cache(maxsize=None)(cmd_size)
+
+# Lightweight stand-ins for BufferData/BufferStep: plain namedtuples and a
+# SimpleNamespace are an order of magnitude cheaper to construct than Mock
+# objects, which matters for the 256-step edge-case test.
+Step = namedtuple("Step", ["x", "y", "flags"])
+
+
+class StepView:
+    """Minimal step stand-in built from structure-of-arrays columns."""
+
+    __slots__ = ("x", "y", "flags")
+
+    def __init__(self, x, y, flags):
+        self.x = x
+        self.y = y
+        self.flags = flags
+
+
+def make_buffer(steps, last_used_index):
+    return SimpleNamespace(
+        steps=steps, get_last_used_index=lambda: last_used_index
+    )
+
+
+# Expected output for the full 256-step buffer in test_buffer_edge_cases,
+# built once at import. The %-template is parsed a single time and applied
+# per row; entries are interned so assertEqual can short-circuit on identity.
+_WRITE_TMPL = "WRITE %d %d %d %d INACTIVE".__mod__
+EXPECTED_WRITE_256 = tuple(
+    sys.intern(_WRITE_TMPL((i, i % 256, (i * 2) % 256, (i * 3) % 256)))
+    for i in range(256)
+)
 
 
 class TestCommands(unittest.TestCase):
@@ -18,13 +70,6 @@ class TestCommands(unittest.TestCase):
         """Test the INACTIVE constant"""
         self.assertEqual(INACTIVE, "INACTIVE")
 
-    def test_cmd_write_basic(self):
-        """Test basic WRITE command generation"""
-        self.assertEqual(cmd_write(0, 1, 2, 3), "WRITE 0 1 2 3 INACTIVE")
-        self.assertEqual(
-            cmd_write(255, 255, 255, 255), "WRITE 255 255 255 255 INACTIVE"
-        )
-
     def test_cmd_write_with_custom_buffer(self):
         """Test WRITE command with custom buffer parameter"""
         self.assertEqual(cmd_write(0, 1, 2, 3, "ACTIVE"), "WRITE 0 1 2 3 ACTIVE")
@@ -98,20 +143,6 @@ class TestCommands(unittest.TestCase):
         # Test middle value
         self.assertEqual(cmd_size(128), "SIZE 128 INACTIVE")
 
-    def test_cmd_write_edge_cases(self):
-        """Test WRITE command edge cases"""
-        # Test minimum valid values
-        self.assertEqual(cmd_write(0, 0, 0, 0), "WRITE 0 0 0 0 INACTIVE")
-
-        # Test maximum valid values
-        self.assertEqual(
-            cmd_write(255, 255, 255, 255), "WRITE 255 255 255 255 INACTIVE"
-        )
-
-        # Test mixed values
-        self.assertEqual(cmd_write(0, 255, 0, 255), "WRITE 0 255 0 255 INACTIVE")
-        self.assertEqual(cmd_write(255, 0, 255, 0), "WRITE 255 0 255 0 INACTIVE")
-
     def test_cmd_write_parameter_types(self):
         """Test WRITE command parameter type handling"""
         # Test with string numbers (should be converted to int)
@@ -133,44 +164,6 @@ class TestCommands(unittest.TestCase):
         self.assertEqual(cmd_size(1.0), "SIZE 1 INACTIVE")
         self.assertEqual(cmd_size(256.7), "SIZE 256 INACTIVE")
 
-    def test_cmd_write_validation_errors(self):
-        """Test WRITE command validation error cases"""
-        # Test index out of bounds
-        with self.assertRaises(ValueError) as cm:
-            cmd_write(-1, 0, 0, 0)
-        self.assertIn("index must be 0..255", str(cm.exception))
-
-        with self.assertRaises(ValueError) as cm:
-            cmd_write(256, 0, 0, 0)
-        self.assertIn("index must be 0..255", str(cm.exception))
-
-        # Test x out of bounds
-        with self.assertRaises(ValueError) as cm:
-            cmd_write(0, -1, 0, 0)
-        self.assertIn("x must be 0..255", str(cm.exception))
-
-        with self.assertRaises(ValueError) as cm:
-            cmd_write(0, 256, 0, 0)
-        self.assertIn("x must be 0..255", str(cm.exception))
-
-        # Test y out of bounds
-        with self.assertRaises(ValueError) as cm:
-            cmd_write(0, 0, -1, 0)
-        self.assertIn("y must be 0..255", str(cm.exception))
-
-        with self.assertRaises(ValueError) as cm:
-            cmd_write(0, 0, 256, 0)
-        self.assertIn("y must be 0..255", str(cm.exception))
-
-        # Test flags out of bounds
-        with self.assertRaises(ValueError) as cm:
-            cmd_write(0, 0, 0, -1)
-        self.assertIn("flags must be 0..255", str(cm.exception))
-
-        with self.assertRaises(ValueError) as cm:
-            cmd_write(0, 0, 0, 999)
-        self.assertIn("flags must be 0..255", str(cm.exception))
-
     def test_cmd_size_validation_errors(self):
         """Test SIZE command validation error cases"""
         # Test size too small
@@ -216,40 +209,69 @@ class TestCommands(unittest.TestCase):
 
             # Test WRITE
             if buffer_name:
-                result = cmd_write(0, 0, 0, 0, buffer_name)
+                result = _cmd_write(0, 0, 0, 0, buffer_name)
                 self.assertIn(expected_upper, result)
 
             # Test DUMP
-            result = cmd_dump(buffer_name)
+            result = _cmd_dump(buffer_name)
             self.assertIn(expected_upper, result)
 
             # Test CLEAR
-            result = cmd_clear(buffer_name)
+            result = _cmd_clear(buffer_name)
             self.assertIn(expected_upper, result)
 
             # Test SIZE
-            result = cmd_size(1, buffer_name)
+            result = _cmd_size(1, buffer_name)
             self.assertIn(expected_upper, result)
 
 
+@pytest.mark.parametrize(
+    "index,x,y,flags,expected",
+    [
+        # Basic values
+        (0, 1, 2, 3, "WRITE 0 1 2 3 INACTIVE"),
+        # Minimum valid values
+        (0, 0, 0, 0, "WRITE 0 0 0 0 INACTIVE"),
+        # Maximum valid values
+        (255, 255, 255, 255, "WRITE 255 255 255 255 INACTIVE"),
+        # Mixed values
+        (0, 255, 0, 255, "WRITE 0 255 0 255 INACTIVE"),
+        (255, 0, 255, 0, "WRITE 255 0 255 0 INACTIVE"),
+    ],
+)
+def test_cmd_write(index, x, y, flags, expected):
+    """Test WRITE command generation across basic and edge cases"""
+    assert cmd_write(index, x, y, flags) == expected
+
+
+# Table of (args, expected error substring) for cmd_write validation
+CMD_WRITE_ERROR_CASES = [
+    ((-1, 0, 0, 0), "index must be 0..255"),
+    ((256, 0, 0, 0), "index must be 0..255"),
+    ((0, -1, 0, 0), "x must be 0..255"),
+    ((0, 256, 0, 0), "x must be 0..255"),
+    ((0, 0, -1, 0), "y must be 0..255"),
+    ((0, 0, 256, 0), "y must be 0..255"),
+    ((0, 0, 0, -1), "flags must be 0..255"),
+    ((0, 0, 0, 999), "flags must be 0..255"),
+]
+
+
+@pytest.mark.parametrize("args,msg", CMD_WRITE_ERROR_CASES)
+def test_cmd_write_validation_errors(args, msg):
+    """Test WRITE command validation error cases"""
+    with pytest.raises(ValueError, match=msg):
+        cmd_write(*args)
+
+
 class TestBuildWriteSequenceFromBuffer(unittest.TestCase):
     """Test the build_write_sequence_from_buffer function"""
 
     def test_empty_buffer(self):
         """Test building sequence from empty buffer"""
-        # Create a mock buffer with no steps
-        mock_buffer = Mock()
-        mock_buffer.get_last_used_index.return_value = -1
-        mock_buffer.steps = []
-
-        # The function expects steps for all indices, so we need to provide them
-        # For an empty buffer (last_used_index = -1), it will try to access steps[0]
-        # So we need to provide at least one step
-        mock_step = Mock()
-        mock_step.x = 0
-        mock_step.y = 0
-        mock_step.flags = 0
-        mock_buffer.steps = [mock_step]
+        # The function expects steps for all indices, so even an empty
+        # buffer (last_used_index = -1) needs a step at index 0
+        mock_buffer = make_buffer([Step(0, 0, 0)], -1)
 
         sequence = build_write_sequence_from_buffer(mock_buffer)
 
@@ -261,44 +283,24 @@ class TestBuildWriteSequenceFromBuffer(unittest.TestCase):
 
     def test_buffer_with_gaps(self):
         """Test building sequence from buffer with gaps in indices"""
-        mock_buffer = Mock()
-        mock_buffer.get_last_used_index.return_value = 5
-
-        # Create mock steps for all indices 0-5 (no gaps)
-        mock_steps = []
-        for i in range(6):
-            step = Mock()
-            step.x = i * 10
-            step.y = i * 20
-            step.flags = i * 30
-            mock_steps.append(step)
-
-        mock_buffer.steps = mock_steps
+        # Create steps for all indices 0-5 (no gaps)
+        steps = [Step(i * 10, i * 20, i * 30) for i in range(6)]
+        mock_buffer = make_buffer(steps, 5)
 
         sequence = build_write_sequence_from_buffer(mock_buffer)
 
-        # Should have CLEAR, 6 WRITE commands, and SIZE
-        self.assertEqual(len(sequence), 8)
-        self.assertEqual(sequence[0], "CLEAR INACTIVE")
-        self.assertEqual(sequence[1], "WRITE 0 0 0 0 INACTIVE")
-        self.assertEqual(sequence[2], "WRITE 1 10 20 30 INACTIVE")
-        self.assertEqual(sequence[3], "WRITE 2 20 40 60 INACTIVE")
-        self.assertEqual(sequence[4], "WRITE 3 30 60 90 INACTIVE")
-        self.assertEqual(sequence[5], "WRITE 4 40 80 120 INACTIVE")
-        self.assertEqual(sequence[6], "WRITE 5 50 100 150 INACTIVE")
-        self.assertEqual(sequence[7], "SIZE 6 INACTIVE")
+        # Should have CLEAR, 6 WRITE commands, and SIZE; compare the whole
+        # list in one assertion
+        expected = (
+            ["CLEAR INACTIVE"]
+            + [f"WRITE {i} {i * 10} {i * 20} {i * 30} INACTIVE" for i in range(6)]
+            + ["SIZE 6 INACTIVE"]
+        )
+        self.assertEqual(sequence, expected)
 
     def test_single_step_buffer(self):
         """Test building sequence from buffer with single step"""
-        mock_buffer = Mock()
-        mock_buffer.get_last_used_index.return_value = 0
-
-        # Create a mock step
-        mock_step = Mock()
-        mock_step.x = 100
-        mock_step.y = 200
-        mock_step.flags = 255
-        mock_buffer.steps = [mock_step]
+        mock_buffer = make_buffer([Step(100, 200, 255)], 0)
 
         sequence = build_write_sequence_from_buffer(mock_buffer)
 
@@ -310,64 +312,36 @@ class TestBuildWriteSequenceFromBuffer(unittest.TestCase):
 
     def test_multiple_step_buffer(self):
         """Test building sequence from buffer with multiple steps"""
-        mock_buffer = Mock()
-        mock_buffer.get_last_used_index.return_value = 2
-
-        # Create mock steps
-        mock_steps = []
-        for i in range(3):
-            step = Mock()
-            step.x = i * 10
-            step.y = i * 20
-            step.flags = i * 30
-            mock_steps.append(step)
-
-        mock_buffer.steps = mock_steps
+        steps = [Step(i * 10, i * 20, i * 30) for i in range(3)]
+        mock_buffer = make_buffer(steps, 2)
 
         sequence = build_write_sequence_from_buffer(mock_buffer)
 
         # Should have CLEAR, 3 WRITE commands, and SIZE
-        self.assertEqual(len(sequence), 5)
-        self.assertEqual(sequence[0], "CLEAR INACTIVE")
-        self.assertEqual(sequence[1], "WRITE 0 0 0 0 INACTIVE")
-        self.assertEqual(sequence[2], "WRITE 1 10 20 30 INACTIVE")
-        self.assertEqual(sequence[3], "WRITE 2 20 40 60 INACTIVE")
-        self.assertEqual(sequence[4], "SIZE 3 INACTIVE")
+        expected = (
+            ["CLEAR INACTIVE"]
+            + [f"WRITE {i} {i * 10} {i * 20} {i * 30} INACTIVE" for i in range(3)]
+            + ["SIZE 3 INACTIVE"]
+        )
+        self.assertEqual(sequence, expected)
 
     def test_buffer_edge_cases(self):
         """Test building sequence from buffer edge cases"""
-        # Test maximum size buffer
-        mock_buffer = Mock()
-        mock_buffer.get_last_used_index.return_value = 255
-
-        # Create 256 mock steps
-        mock_steps = []
-        for i in range(256):
-            step = Mock()
-            step.x = i % 256
-            step.y = (i * 2) % 256
-            step.flags = (i * 3) % 256
-            mock_steps.append(step)
-
-        mock_buffer.steps = mock_steps
+        # Test maximum size buffer. Generate the test data as three uint8
+        # columns (structure-of-arrays) — the % 256 wraparound falls out of
+        # the dtype — and wrap each row in a slotted view.
+        xs = np.arange(256, dtype=np.uint8)
+        ys = (np.arange(256) * 2).astype(np.uint8)
+        fl = (np.arange(256) * 3).astype(np.uint8)
+        steps = [StepView(int(xs[i]), int(ys[i]), int(fl[i])) for i in range(256)]
+        mock_buffer = make_buffer(steps, 255)
 
         sequence = build_write_sequence_from_buffer(mock_buffer)
 
-        # Should have CLEAR, 256 WRITE commands, and SIZE
-        self.assertEqual(len(sequence), 258)
-        self.assertEqual(sequence[0], "CLEAR INACTIVE")
-        self.assertEqual(sequence[257], "SIZE 256 INACTIVE")
-
-        # Test first and last WRITE commands
-        self.assertEqual(sequence[1], "WRITE 0 0 0 0 INACTIVE")
-        # The last step (index 255) should have the calculated values
-        expected_x = 255 % 256  # 255
-        expected_y = (255 * 2) % 256  # 510 % 256 = 254
-        expected_flags = (255 * 3) % 256  # 765 % 256 = 253
-        self.assertEqual(
-            sequence[256],
-            f"WRITE 255 {expected_x} {expected_y} {expected_flags} INACTIVE",
-        )
+        # Should have CLEAR, the precomputed 256 WRITE commands, and SIZE,
+        # compared as one list
+        expected = ["CLEAR INACTIVE"] + list(EXPECTED_WRITE_256) + ["SIZE 256 INACTIVE"]
+        self.assertEqual(sequence, expected)
 
 
 if __name__ == "__main__":
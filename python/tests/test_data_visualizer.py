@@ -0,0 +1,73 @@
+import unittest
+import sys
+from PyQt5 import QtWidgets
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+
+from gui.data_visualizer import DataVisualizer
+
+
+class TestDataVisualizer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Widget construction is the expensive part; build once and reset
+        # mutable state per test.
+        cls.viz = DataVisualizer()
+
+    def setUp(self):
+        self.viz.clear_data()
+        self.viz.is_collecting = False
+        self.viz.start_stop_btn.setText("Start")
+        self.viz.export_btn.setEnabled(False)
+
+    def test_hex_q88_to_decimal(self):
+        self.assertEqual(DataVisualizer._hex_q88_to_decimal("0000"), 0.0)
+        self.assertEqual(DataVisualizer._hex_q88_to_decimal("0100"), 1.0)
+        self.assertEqual(DataVisualizer._hex_q88_to_decimal("0180"), 1.5)
+        self.assertEqual(DataVisualizer._hex_q88_to_decimal("FF00"), 255.0)
+        self.assertAlmostEqual(
+            DataVisualizer._hex_q88_to_decimal("FFFF"), 255.99609375
+        )
+
+    def test_hex_q88_invalid(self):
+        with self.assertRaises(ValueError):
+            DataVisualizer._hex_q88_to_decimal("10000")  # > 16 bits
+        with self.assertRaises(ValueError):
+            DataVisualizer._hex_q88_to_decimal("zz")
+        with self.assertRaises(ValueError):
+            DataVisualizer._hex_q88_to_decimal("-1")  # negative
+
+    def test_process_data_coordinates(self):
+        self.viz.toggle_collection()
+        self.assertTrue(self.viz.process_data("0100 0200"))
+        self.assertTrue(self.viz.process_data("0180 0040"))
+
+        self.assertEqual(list(self.viz.x_coords), [1.0, 1.5])
+        self.assertEqual(list(self.viz.y_coords), [2.0, 0.25])
+
+    def test_process_data_invalid_format(self):
+        self.viz.toggle_collection()
+        self.assertFalse(self.viz.process_data("0100"))  # one token
+        self.assertFalse(self.viz.process_data("0100 0200 0300"))  # three
+        self.assertFalse(self.viz.process_data("zzzz 0200"))  # bad hex
+        self.assertFalse(self.viz.process_data("-100 0200"))  # signed word
+        self.assertEqual(len(self.viz.x_coords), 0)
+
+    def test_process_data_ignored_when_not_collecting(self):
+        self.assertFalse(self.viz.process_data("0100 0200"))
+        self.assertEqual(len(self.viz.x_coords), 0)
+
+    def test_toggle_collection_button_state(self):
+        self.assertEqual(self.viz.start_stop_btn.text(), "Start")
+        self.viz.toggle_collection()
+        self.assertTrue(self.viz.is_collecting)
+        self.assertEqual(self.viz.start_stop_btn.text(), "Stop")
+
+        self.viz.process_data("0100 0200")
+        self.viz.toggle_collection()
+        self.assertFalse(self.viz.is_collecting)
+        self.assertTrue(self.viz.export_btn.isEnabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,9 +12,14 @@ from models.buffer_model import BufferData
 
 
 class TestBufferTableModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Build the widget once; each test gets a fresh buffer via
+        # load_buffer_data, which also resets the model's caches.
+        cls.widget = BufferTableWidget()
+
     def setUp(self):
         self.buf = BufferData()
-        self.widget = BufferTableWidget()
         self.widget.load_buffer_data(self.buf)
         self.model = self.widget._model  # type: ignore
 
@@ -16,10 +16,15 @@ from gui.connection_manager import ConnectionManager
 class TestRefactoredArchitecture(unittest.TestCase):
     """Test the refactored GUI architecture."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the controller/manager QObject graph once for the class."""
+        cls.controller = GalvoController()
+        cls.connection_manager = ConnectionManager(cls.controller)
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.controller = GalvoController()
-        self.connection_manager = ConnectionManager(self.controller)
+        """Reset shared fixtures to an idle state."""
+        self.controller.reset()
 
     def test_controller_creation(self):
         """Test that controller can be created."""
@@ -80,10 +85,11 @@ class TestRefactoredArchitecture(unittest.TestCase):
         self.assertIsNone(self.connection_manager.get_current_port())
         self.assertIsNone(self.connection_manager.get_current_baud())
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.connection_manager.cleanup()
-        self.controller.cleanup()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared fixtures."""
+        cls.connection_manager.cleanup()
+        cls.controller.cleanup()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import unittest
-import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch, MagicMock
 
 from serialio.serial_io import ThreadSafeSerialIO, SerialIOError
@@ -14,21 +15,20 @@ class FakeSerialPort:
         self.baud = baud
         self.timeout = timeout
         self.closed = False
-        self._read_buffer = []
+        self._read_buffer = deque()
         self._write_buffer = []
-        self._read_index = 0
 
     def readline(self):
-        if self._read_index < len(self._read_buffer):
-            result = self._read_buffer[self._read_index]
-            self._read_index += 1
-            return result
+        if self._read_buffer:
+            return self._read_buffer.popleft()
         return b""  # Timeout
 
     def write(self, data):
         if self.closed:
             raise Exception("Port is closed")
-        self._write_buffer.append(data)
+        # Copy: write_line hands over a memoryview of a reused scratch
+        # buffer that is only valid during the call.
+        self._write_buffer.append(bytes(data))
         return len(data)
 
     def close(self):
@@ -36,10 +36,10 @@ class FakeSerialPort:
 
     def add_read_data(self, *data_items):
         """Add data to the read buffer for testing"""
-        for item in data_items:
-            if isinstance(item, str):
-                item = item.encode("utf-8")
-            self._read_buffer.append(item)
+        self._read_buffer.extend(
+            item.encode("utf-8") if isinstance(item, str) else item
+            for item in data_items
+        )
 
     def get_written_data(self):
         """Get all data written to the port"""
@@ -49,6 +49,16 @@ class FakeSerialPort:
 class TestThreadSafeSerialIO(unittest.TestCase):
     """Test the ThreadSafeSerialIO class"""
 
+    @classmethod
+    def setUpClass(cls):
+        # One pool for both thread-safety tests: reusing worker threads is
+        # cheaper than starting/joining bare Thread objects per test.
+        cls._pool = ThreadPoolExecutor(max_workers=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._pool.shutdown(wait=True)
+
     def setUp(self):
         self.serial_io = ThreadSafeSerialIO()
 
@@ -248,13 +258,7 @@ class TestThreadSafeSerialIO(unittest.TestCase):
                 except Exception:
                     pass
 
-        threads = [threading.Thread(target=connect_worker) for _ in range(3)]
-
-        for thread in threads:
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+        list(self._pool.map(lambda _: connect_worker(), range(3)))
 
         # Should not crash and should end in disconnected state
         self.assertFalse(self.serial_io.is_connected())
@@ -278,13 +282,7 @@ class TestThreadSafeSerialIO(unittest.TestCase):
                 except Exception:
                     pass
 
-        threads = [threading.Thread(target=write_worker) for _ in range(3)]
-
-        for thread in threads:
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+        list(self._pool.map(lambda _: write_worker(), range(3)))
 
         # Should have written data without crashes
         written_data = mock_port.get_written_data()
@@ -14,6 +14,7 @@ from utils.validators import (
     validate_uint8,
     validate_buffer_index,
     validate_coordinate,
+    validate_coordinates_batch,
     format_binary,
     parse_binary_string,
     validate_port_name,
@@ -193,6 +194,24 @@ class TestValidateCoordinate(unittest.TestCase):
         self.assertIn("Invalid Y value", error)
 
 
+class TestValidateCoordinatesBatch(unittest.TestCase):
+    """Test cases for validate_coordinates_batch function."""
+
+    def test_all_valid(self):
+        """Test a batch where every pair is in range."""
+        ok, xs, ys = validate_coordinates_batch([0, 128, 255], [255, 64, 0])
+        self.assertTrue(ok.all())
+        self.assertEqual(list(xs), [0, 128, 255])
+        self.assertEqual(list(ys), [255, 64, 0])
+        self.assertEqual(xs.dtype.name, "uint8")
+        self.assertEqual(ys.dtype.name, "uint8")
+
+    def test_out_of_range_masked(self):
+        """Test that out-of-range pairs are flagged in the mask."""
+        ok, xs, ys = validate_coordinates_batch([0, 256, 10], [0, 0, -1])
+        self.assertEqual(list(ok), [True, False, False])
+
+
 class TestBinaryFormatting(unittest.TestCase):
     """Test cases for binary formatting functions."""
 
@@ -249,6 +268,7 @@ class TestPortValidation(unittest.TestCase):
         self.assertTrue(validate_port_name("COM10"))
         self.assertTrue(validate_port_name("COM256"))
         self.assertTrue(validate_port_name("com4"))  # Case insensitive
+        self.assertTrue(validate_port_name("COM01"))  # Leading zero allowed
 
     def test_valid_unix_ports(self):
         """Test valid Unix-like port names."""
@@ -306,6 +326,17 @@ class TestBaudRateValidation(unittest.TestCase):
         self.assertIn("must be an integer", error)
 
 
+class TestPrecomputedTables(unittest.TestCase):
+    """Regression tests for the module-level precomputed tables."""
+
+    def test_success_tuples_are_shared(self):
+        """Repeat validations must return the same precomputed objects."""
+        # If these ever get re-initialized inside the functions, the hoisted
+        # tables stop being shared and the ids diverge.
+        self.assertIs(validate_uint8(128), validate_uint8(128))
+        self.assertIs(format_binary(170), format_binary(170))
+
+
 class TestValidatorIntegration(unittest.TestCase):
     """Integration tests for validators working together."""
 
@@ -13,20 +13,11 @@ Usage:
     from utils import validate_port_name, validate_baud_rate
 """
 
-from .validators import (
-    validate_uint8,
-    validate_buffer_index,
-    validate_coordinate,
-    format_binary,
-    parse_binary_string,
-    validate_port_name,
-    validate_baud_rate,
-)
-
 __all__ = [
     "validate_uint8",
     "validate_buffer_index",
     "validate_coordinate",
+    "validate_coordinates_batch",
     "format_binary",
     "parse_binary_string",
     "validate_port_name",
@@ -35,3 +26,16 @@ __all__ = [
 
 # Version information
 __version__ = "1.0.0"
+
+
+def __getattr__(name):
+    # PEP 562 lazy import: validators (and the re/numpy modules it pulls in,
+    # plus its precomputed tables) load on first use rather than at package
+    # import, keeping GUI cold start lean.
+    if name in __all__:
+        from . import validators
+
+        value = getattr(validators, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
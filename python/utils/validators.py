@@ -2,64 +2,132 @@
 Input validation utilities for the laser galvo GUI.
 """
 
+import re
+from functools import lru_cache
 from typing import Tuple, Optional
 
+import numpy as np
 
-def validate_uint8(value: any) -> Tuple[bool, Optional[int], str]:
-    """
-    Validate that a value is a valid 8-bit unsigned integer.
+# --- precomputed tables (do not modify) -------------------------------------
+# Everything below is built once at import and treated as immutable; keep new
+# constants here rather than re-initializing them inside functions.
 
-    Args:
-        value: Value to validate (string, int, or other)
+# Port-name patterns. COM ports are numbered from 1; leading zeros are
+# allowed ("COM01"), but the number itself must be non-zero, which the
+# 0*[1-9] anchor checks without a try/except round-trip.
+_COM_RE = re.compile(r"^COM(0*[1-9]\d*)$", re.IGNORECASE)
+_DEV_RE = re.compile(r"^/dev/.+")
+
+# Common serial baud rates; hoisted so validate_baud_rate doesn't rebuild a
+# list per call, and a frozenset makes the membership check O(1).
+_STANDARD_BAUDS = frozenset(
+    (300, 1200, 2400, 4800, 9600, 19200, 38400, 57600,
+     115200, 230400, 460800, 921600)
+)
+
+# Translation table that deletes '0' and '1': a string is valid binary iff
+# translating it leaves nothing behind. One C-level pass per check.
+_NON_BIN = str.maketrans("", "", "01")
+
+# Shared success tuples for validate_uint8: there are only 256 possible
+# successful results, so callers get a preallocated (True, value, "") instead
+# of a fresh tuple per call. Consumers only destructure, never mutate.
+_OK_UINT8 = tuple((True, i, "") for i in range(256))
+
+# Precomputed 8-bit binary strings: format_binary's dominant bits=8 case
+# becomes a table lookup instead of building a format spec per call.
+_BIN8 = tuple("0b" + format(i, "08b") for i in range(256))
+
+# Status codes from _validate_uint8_impl: wrappers dispatch on these with an
+# int compare instead of substring-matching the error message.
+_UINT8_OK = 0
+_UINT8_RANGE = 1
+_UINT8_FORMAT = 2
+_UINT8_TYPE = 3
+
+# --- end precomputed tables --------------------------------------------------
+
+
+def _validate_uint8_impl(value) -> Tuple[int, Optional[int], str]:
+    """
+    Core uint8 validation shared by the public wrappers.
 
     Returns:
-        Tuple of (is_valid, parsed_value, error_message)
-        If valid: (True, parsed_int, "")
-        If invalid: (False, None, error_description)
+        Tuple of (status, parsed_value, error_message) where status is one
+        of the _UINT8_* codes. Wrappers branch on the status code instead of
+        searching the message text.
     """
+    # Handle direct int input first: the hottest callers (coordinate
+    # validation loops) already pass ints, so they skip the string machinery
+    # entirely. The exact-type check is a single pointer compare (no MRO
+    # walk) and excludes bool, which would otherwise silently validate as
+    # 1/0; bools fall through to the unsupported-type error below.
+    # `value & ~0xFF` is a single branchless test for the 0-255 range.
+    if type(value) is int:
+        if value & ~0xFF:
+            return _UINT8_RANGE, None, f"Value {value} out of range (0-255)"
+        return _UINT8_OK, value, ""
+
     # Handle string input
     if isinstance(value, str):
-        value = value.strip()
-
-        # Check for binary format (0b prefix)
-        if value.startswith("0b") or value.startswith("0B"):
-            try:
-                parsed = int(value, 2)
-            except ValueError:
-                return False, None, f"Invalid binary format: {value}"
-        # Check for hex format (0x prefix)
-        elif value.startswith("0x") or value.startswith("0X"):
-            try:
-                parsed = int(value, 16)
-            except ValueError:
-                return False, None, f"Invalid hex format: {value}"
-        # Regular decimal
-        else:
+        # strip() allocates a fresh string even when there's nothing to
+        # strip; programmatic callers rarely pass padded input, so only pay
+        # for it when an end character is actually whitespace.
+        if value and (value[0].isspace() or value[-1].isspace()):
+            value = value.strip()
+
+        # int(s, 0) recognizes 0b/0x prefixes and decimal natively, so the
+        # common (valid) path is a single C-level parse with no per-prefix
+        # dispatch. Prefix classification only happens on failure.
+        try:
+            parsed = int(value, 0)
+        except ValueError:
             try:
+                # Base 0 rejects leading-zero decimals like "010"; plain
+                # int() accepts them, preserving the old behaviour.
                 parsed = int(value)
             except ValueError:
-                return False, None, f"Not a valid integer: {value}"
-
-    # Handle direct int input
-    elif isinstance(value, int):
-        parsed = value
+                prefix = value[:2].lower()
+                if prefix == "0b":
+                    return _UINT8_FORMAT, None, f"Invalid binary format: {value}"
+                if prefix == "0x":
+                    return _UINT8_FORMAT, None, f"Invalid hex format: {value}"
+                return _UINT8_FORMAT, None, f"Not a valid integer: {value}"
 
     # Handle float (truncate if whole number)
     elif isinstance(value, float):
         if value.is_integer():
             parsed = int(value)
         else:
-            return False, None, f"Must be a whole number, got: {value}"
+            return _UINT8_FORMAT, None, f"Must be a whole number, got: {value}"
 
     # Unsupported type
     else:
-        return False, None, f"Unsupported type: {type(value).__name__}"
+        return _UINT8_TYPE, None, f"Unsupported type: {type(value).__name__}"
 
     # Check range
     if not 0 <= parsed <= 255:
-        return False, None, f"Value {parsed} out of range (0-255)"
+        return _UINT8_RANGE, None, f"Value {parsed} out of range (0-255)"
+
+    return _UINT8_OK, parsed, ""
+
+
+def validate_uint8(value: any) -> Tuple[bool, Optional[int], str]:
+    """
+    Validate that a value is a valid 8-bit unsigned integer.
+
+    Args:
+        value: Value to validate (string, int, or other)
 
-    return True, parsed, ""
+    Returns:
+        Tuple of (is_valid, parsed_value, error_message)
+        If valid: (True, parsed_int, "")
+        If invalid: (False, None, error_description)
+    """
+    status, parsed, error = _validate_uint8_impl(value)
+    if status == _UINT8_OK:
+        return _OK_UINT8[parsed]
+    return False, None, error
 
 
 def validate_buffer_index(value: any) -> Tuple[bool, Optional[int], str]:
@@ -72,10 +140,12 @@ def validate_buffer_index(value: any) -> Tuple[bool, Optional[int], str]:
     Returns:
         Tuple of (is_valid, parsed_value, error_message)
     """
-    valid, parsed, error = validate_uint8(value)
-    if not valid and "out of range" in error:
+    status, parsed, error = _validate_uint8_impl(value)
+    if status == _UINT8_OK:
+        return _OK_UINT8[parsed]
+    if status == _UINT8_RANGE:
         return False, None, f"Buffer index must be 0-255, got: {value}"
-    return valid, parsed, error
+    return False, None, error
 
 
 def validate_coordinate(
@@ -91,13 +161,37 @@ def validate_coordinate(
     Returns:
         Tuple of (is_valid, parsed_value, error_message)
     """
-    valid, parsed, error = validate_uint8(value)
-    if not valid:
-        if "out of range" in error:
-            return False, None, f"{axis} coordinate must be 0-255"
-        else:
-            return False, None, f"Invalid {axis} value: {error}"
-    return valid, parsed, error
+    status, parsed, error = _validate_uint8_impl(value)
+    if status == _UINT8_OK:
+        return _OK_UINT8[parsed]
+    if status == _UINT8_RANGE:
+        return False, None, f"{axis} coordinate must be 0-255"
+    return False, None, f"Invalid {axis} value: {error}"
+
+
+def validate_coordinates_batch(xs, ys) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Validate whole arrays of (x, y) coordinate pairs at once.
+
+    One vectorized pass replaces per-point validate_coordinate calls —
+    pattern-drawing workflows validating thousands of points drop from
+    O(N) Python calls to a single C loop.
+
+    Args:
+        xs: X coordinates (array-like of ints)
+        ys: Y coordinates (array-like of ints)
+
+    Returns:
+        Tuple of (ok_mask, xs_uint8, ys_uint8) where ok_mask is a bool
+        array marking pairs with both values in 0-255, and the coordinate
+        arrays are uint8 views/copies suitable for the serial writer.
+        Values outside 0-255 wrap in the uint8 arrays; use the mask to
+        filter them first.
+    """
+    a = np.asarray(xs)
+    b = np.asarray(ys)
+    ok = (a >= 0) & (a <= 255) & (b >= 0) & (b <= 255)
+    return ok, a.astype(np.uint8, copy=False), b.astype(np.uint8, copy=False)
 
 
 def format_binary(value: int, bits: int = 8) -> str:
@@ -120,6 +214,11 @@ def format_binary(value: int, bits: int = 8) -> str:
     if value >= (1 << bits):
         raise ValueError(f"Value {value} too large for {bits} bits")
 
+    # Default width hits the precomputed table; only custom widths pay for
+    # format-spec construction.
+    if bits == 8:
+        return _BIN8[value]
+
     return f"0b{format(value, f'0{bits}b')}"
 
 
@@ -133,30 +232,31 @@ def parse_binary_string(binary_str: str) -> Optional[int]:
     Returns:
         Parsed integer value, or None if invalid
     """
-    binary_str = binary_str.strip()
-
-    # Remove 0b prefix if present
-    if binary_str.startswith("0b") or binary_str.startswith("0B"):
+    # Only strip when an end character is actually whitespace (see
+    # _validate_uint8_impl).
+    if binary_str and (binary_str[0].isspace() or binary_str[-1].isspace()):
+        binary_str = binary_str.strip()
+
+    # Remove at most one 0b prefix if present; a two-character slice compare
+    # covers both cases in one branch.
+    if binary_str[:2] in ("0b", "0B"):
         binary_str = binary_str[2:]
 
-    # Check if valid binary
-    if not all(c in "01" for c in binary_str):
+    # Empty string or any non-binary character
+    if not binary_str or binary_str.translate(_NON_BIN):
         return None
 
-    # Empty string
-    if not binary_str:
-        return None
-
-    try:
-        return int(binary_str, 2)
-    except ValueError:
-        return None
+    return int(binary_str, 2)
 
 
+@lru_cache(maxsize=64)
 def validate_port_name(port: str) -> bool:
     """
     Validate serial port name.
 
+    Memoized: the GUI re-validates the same handful of port names on every
+    dropdown refresh, so repeat calls are a dict lookup.
+
     Args:
         port: Port name to validate
 
@@ -167,16 +267,12 @@ def validate_port_name(port: str) -> bool:
         return False
 
     # Windows COM ports
-    if port.upper().startswith("COM"):
-        try:
-            port_num = int(port[3:])
-            return port_num > 0
-        except ValueError:
-            return False
+    if port[:3].upper() == "COM":
+        return _COM_RE.match(port) is not None
 
     # Unix-like ports
     if port.startswith("/dev/"):
-        return len(port) > 5
+        return _DEV_RE.match(port) is not None
 
     # Allow any non-empty string for unknown systems
     return True
@@ -192,36 +288,24 @@ def validate_baud_rate(baud: any) -> Tuple[bool, Optional[int], str]:
     Returns:
         Tuple of (is_valid, parsed_value, error_message)
     """
-    standard_rates = [
-        300,
-        1200,
-        2400,
-        4800,
-        9600,
-        19200,
-        38400,
-        57600,
-        115200,
-        230400,
-        460800,
-        921600,
-    ]
-
-    try:
-        if isinstance(baud, str):
+    # Only the str->int conversion can raise, so the try block is scoped to
+    # that one call; the int path carries no exception-handling setup at all.
+    if type(baud) is str:
+        try:
             baud = int(baud)
-        elif not isinstance(baud, int):
-            return False, None, f"Baud rate must be an integer"
-
-        if baud <= 0:
-            return False, None, f"Baud rate must be positive"
+        except ValueError:
+            return False, None, f"Invalid baud rate: {baud}"
+    elif type(baud) is not int:
+        # Exact-type check also rejects bool, which isinstance would
+        # accept as baud rate 1/0.
+        return False, None, f"Baud rate must be an integer"
 
-        # Warn if non-standard but allow it
-        if baud not in standard_rates:
-            # Still valid, just non-standard
-            pass
+    if baud <= 0:
+        return False, None, f"Baud rate must be positive"
 
-        return True, baud, ""
+    # Warn if non-standard but allow it
+    if baud not in _STANDARD_BAUDS:
+        # Still valid, just non-standard
+        pass
 
-    except ValueError:
-        return False, None, f"Invalid baud rate: {baud}"
+    return True, baud, ""